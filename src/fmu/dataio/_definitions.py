@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Final
 
 from pydantic import BaseModel, model_validator
 
-from fmu.datamodels.fmu_results.enums import Content
+from fmu.datamodels.fmu_results.enums import Content, FileFormat
 from fmu.datamodels.standard_results.enums import InplaceVolumes, SimulatorTables
 
 ERT_RELATIVE_CASE_METADATA_FILE: Final = "share/metadata/fmu_case.yml"
@@ -31,6 +32,35 @@ class FileExtension(StrEnum):
     tsurf = ".ts"
 
 
+POLYGONS_FILE_EXTENSIONS: Final[MappingProxyType[FileFormat, str]] = MappingProxyType(
+    {
+        FileFormat.irap_ascii: FileExtension.pol.value,
+        FileFormat.csv: FileExtension.csv.value,
+        FileFormat.csv_xtgeo: FileExtension.csv.value,
+        FileFormat.parquet: FileExtension.parquet.value,
+    }
+)
+"""File extension for each supported polygons file format."""
+
+POINTS_FILE_EXTENSIONS: Final[MappingProxyType[FileFormat, str]] = MappingProxyType(
+    {
+        FileFormat.irap_ascii: FileExtension.poi.value,
+        FileFormat.csv: FileExtension.csv.value,
+        FileFormat.csv_xtgeo: FileExtension.csv.value,
+        FileFormat.parquet: FileExtension.parquet.value,
+    }
+)
+"""File extension for each supported points file format."""
+
+TABLE_FILE_EXTENSIONS: Final[MappingProxyType[FileFormat, str]] = MappingProxyType(
+    {
+        FileFormat.csv: FileExtension.csv.value,
+        FileFormat.parquet: FileExtension.parquet.value,
+    }
+)
+"""File extension for each supported table file format."""
+
+
 class ExportFolder(StrEnum):
     cubes = "cubes"
     dictionaries = "dictionaries"
@@ -97,6 +127,12 @@ STANDARD_TABLE_INDEX_COLUMNS: Final[dict[Content, StandardTableIndex]] = {
     ),
 }
 
+STANDARD_TABLE_INDEX_COLUMN_SETS: Final[dict[Content, frozenset[str]]] = {
+    content: frozenset(standard_index.columns)
+    for content, standard_index in STANDARD_TABLE_INDEX_COLUMNS.items()
+}
+"""Set view of the standard index columns for each content, for membership checks."""
+
 
 class RMSExecutionMode(StrEnum):
     """The modes RMS can execute in. These definitions come from
@@ -22,6 +22,8 @@ from ._base import Provider
 
 logger: Final = null_logger(__name__)
 
+_MULTIPLE_UNDERSCORES: Final = re.compile(r"__+")
+
 if TYPE_CHECKING:
     from fmu.dataio._runcontext import RunContext
 
@@ -124,7 +126,7 @@ class SharePathConstructor:
             .replace("ø", "oe")
             .replace("å", "aa")
         )
-        return re.sub(r"__+", "_", filestem)
+        return _MULTIPLE_UNDERSCORES.sub("_", filestem)
 
 
 class FileDataProvider(Provider):
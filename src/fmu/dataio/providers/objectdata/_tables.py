@@ -7,7 +7,9 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 
 from fmu.dataio._definitions import (
+    STANDARD_TABLE_INDEX_COLUMN_SETS,
     STANDARD_TABLE_INDEX_COLUMNS,
+    TABLE_FILE_EXTENSIONS,
     ExportFolder,
     FileExtension,
 )
@@ -46,7 +48,8 @@ def _validate_input_table_index(
     non-standard table indexes are used or some standard ones are missing.
     """
 
-    missing_columns = [col for col in table_index if col not in table_columns]
+    columns = set(table_columns)
+    missing_columns = [col for col in table_index if col not in columns]
     if missing_columns:
         raise KeyError(
             f"The table index columns {missing_columns} are not present in the table"
@@ -54,9 +57,10 @@ def _validate_input_table_index(
 
     if content in STANDARD_TABLE_INDEX_COLUMNS:
         standard_index = STANDARD_TABLE_INDEX_COLUMNS[content]
+        standard_columns = STANDARD_TABLE_INDEX_COLUMN_SETS[content]
 
         has_all_required = all(col in table_index for col in standard_index.required)
-        has_non_standard = any(col not in standard_index.columns for col in table_index)
+        has_non_standard = any(col not in standard_columns for col in table_index)
 
         if not has_all_required or has_non_standard:
             warnings.warn(
@@ -77,7 +81,8 @@ def _derive_index_from_standard(
     logger.debug("Using standard table_index for content %s", content.value)
     standard_index = STANDARD_TABLE_INDEX_COLUMNS[content]
 
-    table_index = [col for col in standard_index.columns if col in table_columns]
+    columns = set(table_columns)
+    table_index = [col for col in standard_index.columns if col in columns]
     has_all_required = all(col in table_index for col in standard_index.required)
 
     if not table_index:
@@ -101,10 +106,11 @@ def _derive_index_legacy(table_columns: list[str]) -> list[str]:
     Derive all columns in table that is registered as a standard index column,
     independent of the content.
     """
+    columns = set(table_columns)
     table_index = []
     for standard_table_index in STANDARD_TABLE_INDEX_COLUMNS.values():
         for col in standard_table_index.columns:
-            if col in table_columns and col not in table_index:
+            if col in columns and col not in table_index:
                 table_index.append(col)
     return table_index
 
@@ -177,14 +183,12 @@ class DataFrameDataProvider(ObjectDataProvider):
 
     @property
     def extension(self) -> str:
-        if self.fmt == FileFormat.parquet:
-            return FileExtension.parquet.value
-
-        if self.fmt == FileFormat.csv:
-            return FileExtension.csv.value
+        fmt = self.fmt
+        if fmt in TABLE_FILE_EXTENSIONS:
+            return TABLE_FILE_EXTENSIONS[fmt]
 
         raise ConfigurationError(
-            f"The file format {self.fmt.value} is not supported. ",
+            f"The file format {fmt.value} is not supported. ",
             f"Valid formats are: {['parquet', 'csv']}",
         )
 
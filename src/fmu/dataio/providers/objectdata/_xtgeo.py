@@ -10,7 +10,12 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 import xtgeo
 
-from fmu.dataio._definitions import ExportFolder, FileExtension
+from fmu.dataio._definitions import (
+    POINTS_FILE_EXTENSIONS,
+    POLYGONS_FILE_EXTENSIONS,
+    ExportFolder,
+    FileExtension,
+)
 from fmu.dataio._export_config import ExportConfig
 from fmu.dataio._logging import null_logger
 from fmu.dataio._utils import read_metadata_from_file
@@ -203,17 +208,12 @@ class PolygonsDataProvider(ObjectDataProvider):
 
     @property
     def extension(self) -> str:
-        if self.fmt == FileFormat.irap_ascii:
-            return FileExtension.pol.value
-
-        if self.fmt == FileFormat.parquet:
-            return FileExtension.parquet.value
-
-        if self.fmt in [FileFormat.csv, FileFormat.csv_xtgeo]:
-            return FileExtension.csv.value
+        fmt = self.fmt
+        if fmt in POLYGONS_FILE_EXTENSIONS:
+            return POLYGONS_FILE_EXTENSIONS[fmt]
 
         raise ConfigurationError(
-            f"The file format {self.fmt.value} is not supported. ",
+            f"The file format {fmt.value} is not supported. ",
             f"Valid formats are: {['irap_ascii', 'csv', 'csv|xtgeo', 'parquet']}",
         )
 
@@ -317,17 +317,12 @@ class PointsDataProvider(ObjectDataProvider):
 
     @property
     def extension(self) -> str:
-        if self.fmt == FileFormat.irap_ascii:
-            return FileExtension.poi.value
-
-        if self.fmt == FileFormat.parquet:
-            return FileExtension.parquet.value
-
-        if self.fmt in [FileFormat.csv, FileFormat.csv_xtgeo]:
-            return FileExtension.csv.value
+        fmt = self.fmt
+        if fmt in POINTS_FILE_EXTENSIONS:
+            return POINTS_FILE_EXTENSIONS[fmt]
 
         raise ConfigurationError(
-            f"The file format {self.fmt.value} is not supported. ",
+            f"The file format {fmt.value} is not supported. ",
             f"Valid formats are: {['irap_ascii', 'csv', 'csv|xtgeo', 'parquet']}",
         )
 
@@ -2,17 +2,19 @@
 
 import inspect
 import logging
+import pickle
 import shutil
 import sys
 import uuid
 from collections.abc import Callable, Generator
-from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.feather as feather
 import pytest
 import xtgeo
 import yaml
@@ -35,7 +37,7 @@ from fmu.dataio._readers.faultroom import FaultRoomSurface
 from fmu.dataio._readers.tsurf import TSurfData
 from fmu.dataio.dataio import ExportData
 
-from .utils import _metadata_examples
+from .utils import SafeLoader, _metadata_examples
 
 logger = logging.getLogger(__name__)
 
@@ -55,20 +57,41 @@ ERTRUN_ENV_FORWARD = {
     "_ERT_RUNPATH": "---",  # set dynamically due to pytest tmp rotation
 }
 ERTRUN_ENV_FULLRUN = {**ERTRUN_ENV_PREHOOK, **ERTRUN_ENV_FORWARD}
+ERTRUN_ENV_REAL1_ITER0 = {
+    "_ERT_ITERATION_NUMBER": "0",
+    "_ERT_REALIZATION_NUMBER": "1",
+    "_ERT_RUNPATH": "---",  # set dynamically due to pytest tmp rotation
+}
 
 ERT_RUNPATH = "_ERT_RUNPATH"
 
+_yaml_cache: dict[tuple[str, int], bytes] = {}
 
-def _current_function_name() -> str:
-    """Helper to retrieve current function name, e.g. for logging"""
+
+def _log_fixture_ran() -> None:
+    """Helper to log the name of the calling fixture at debug level.
+
+    The caller's frame is only looked up when debug logging is enabled."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     curr_frame = inspect.currentframe()
     assert curr_frame is not None
     assert curr_frame.f_back is not None
-    f_code = curr_frame.f_back.f_code
-    assert f_code is not None
-    co_name = f_code.co_name
-    assert co_name is not None
-    return co_name
+    logger.debug("Ran %s", curr_frame.f_back.f_code.co_name)
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, caching the parsed content by path and modification time.
+
+    The content is cached in pickled form so that every call returns a new copy that
+    tests are free to modify. Unpickling is considerably faster than a deepcopy."""
+    key = (str(path), path.stat().st_mtime_ns)
+    if key not in _yaml_cache:
+        with open(path, encoding="utf-8") as stream:
+            _yaml_cache[key] = pickle.dumps(
+                yaml.load(stream, Loader=SafeLoader), protocol=pickle.HIGHEST_PROTOCOL
+            )
+    return pickle.loads(_yaml_cache[key])
 
 
 @pytest.fixture(scope="session")
@@ -84,11 +107,9 @@ def inside_rms_interactive(monkeypatch: MonkeyPatch) -> None:
 def _set_fmurun_env_variables(
     monkeypatch: MonkeyPatch,
     runpath: Path = Path(""),
-    case_only: bool = False,
+    env: dict[str, str] = ERTRUN_ENV_FULLRUN,
 ) -> None:
-    """Set Ert environment variables based upon the path and stage."""
-    env = ERTRUN_ENV_FULLRUN if not case_only else ERTRUN_ENV_PREHOOK
-
+    """Set Ert environment variables, with the runpath variable set to the path."""
     for key, value in env.items():
         env_value = str(runpath) if "RUNPATH" in key else value
         monkeypatch.setenv(key, env_value)
@@ -123,110 +144,83 @@ def set_ert_env_prehook(monkeypatch: MonkeyPatch) -> Callable[[], None]:
 
 
 @pytest.fixture(scope="function")
-def runpath_no_case_metadata(
+def make_runpath(
     tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path
-) -> Path:
-    """A standard runpath without metadata exported in the case path."""
-    runpath = tmp_path / ERT_CASE_DATA_REAL0_ITER0
-    shutil.copytree(rootpath / ERT_CASE_DATA_REAL0_ITER0, runpath)
-
-    _set_fmurun_env_variables(monkeypatch, runpath=runpath)
+) -> Callable[..., Path]:
+    """Factory cloning Ert case data into the tmp path and mocking a run inside it.
 
-    monkeypatch.chdir(runpath)
-    return runpath
+    The returned function takes the following keyword arguments:
 
+    - case_data: The Ert case data to clone, relative to the repository root.
+    - run_dir: Directory inside the cloned data to use as runpath, and move into.
+    - dotfmu: Whether to create a Drogon .fmu/ directory in the cloned data.
+    - env: Ert environment variables to set, with the runpath variable set to the
+      runpath.
+    """
 
-@pytest.fixture(scope="function")
-def runpath_prehook(tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path) -> Path:
-    """Runpath mocking a prehook context."""
-    runpath = tmp_path / ERT_CASE_DATA
-    shutil.copytree(rootpath / ERT_CASE_DATA, runpath)
-    create_drogon_fmu_dir(runpath)
+    def _make_runpath(
+        case_data: str = ERT_CASE_DATA,
+        run_dir: str = "",
+        dotfmu: bool = True,
+        env: dict[str, str] = ERTRUN_ENV_FULLRUN,
+    ) -> Path:
+        casepath = tmp_path / case_data
+        shutil.copytree(rootpath / case_data, casepath)
+        if dotfmu:
+            create_drogon_fmu_dir(casepath)
 
-    _set_fmurun_env_variables(monkeypatch, runpath=runpath, case_only=True)
+        runpath = casepath / run_dir
+        _set_fmurun_env_variables(monkeypatch, runpath=runpath, env=env)
+        monkeypatch.chdir(runpath)
+        return runpath
 
-    monkeypatch.chdir(runpath)
-    return runpath
+    return _make_runpath
 
 
 @pytest.fixture(scope="function")
-def runpath_no_dotfmu(tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path) -> Path:
-    """Runpath mocking an FMU run without a .fmu/ directory."""
-    runpath = tmp_path / ERT_CASE_DATA
-    shutil.copytree(rootpath / ERT_CASE_DATA, runpath)
-    iter_path = runpath / "realization-0/iter-0"
+def runpath_no_case_metadata(make_runpath: Callable[..., Path]) -> Path:
+    """A standard runpath without metadata exported in the case path."""
+    return make_runpath(case_data=ERT_CASE_DATA_REAL0_ITER0, dotfmu=False)
 
-    _set_fmurun_env_variables(monkeypatch, runpath=iter_path)
 
-    monkeypatch.chdir(iter_path)
-    return iter_path
+@pytest.fixture(scope="function")
+def runpath_prehook(make_runpath: Callable[..., Path]) -> Path:
+    """Runpath mocking a prehook context."""
+    return make_runpath(env=ERTRUN_ENV_PREHOOK)
 
 
 @pytest.fixture(scope="function")
-def runpath(tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path) -> Path:
-    """Runpath mocking an FMU run with a .fmu/ directory."""
-    runpath = tmp_path / ERT_CASE_DATA
-    shutil.copytree(rootpath / ERT_CASE_DATA, runpath)
-    create_drogon_fmu_dir(runpath)
+def runpath_no_dotfmu(make_runpath: Callable[..., Path]) -> Path:
+    """Runpath mocking an FMU run without a .fmu/ directory."""
+    return make_runpath(run_dir="realization-0/iter-0", dotfmu=False)
 
-    iter_path = runpath / "realization-0/iter-0"
-    _set_fmurun_env_variables(monkeypatch, runpath=iter_path)
-    monkeypatch.chdir(iter_path)
 
-    return iter_path
+@pytest.fixture(scope="function")
+def runpath(make_runpath: Callable[..., Path]) -> Path:
+    """Runpath mocking an FMU run with a .fmu/ directory."""
+    return make_runpath(run_dir="realization-0/iter-0")
 
 
 @pytest.fixture(scope="function")
-def runpath_non_equal_real_and_iter(
-    tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path
-) -> Path:
+def runpath_non_equal_real_and_iter(make_runpath: Callable[..., Path]) -> Path:
     """Runpath with non-equal real and iter num."""
-    runpath = tmp_path / ERT_CASE_DATA
-    shutil.copytree(rootpath / ERT_CASE_DATA, runpath)
-    create_drogon_fmu_dir(runpath)
-
-    rootpath = runpath / "realization-1/iter-0"
-
-    monkeypatch.setenv("_ERT_ITERATION_NUMBER", "0")
-    monkeypatch.setenv("_ERT_REALIZATION_NUMBER", "1")
-    monkeypatch.setenv("_ERT_RUNPATH", str(rootpath))
-
-    monkeypatch.chdir(rootpath)
-    return rootpath
+    return make_runpath(run_dir="realization-1/iter-0", env=ERTRUN_ENV_REAL1_ITER0)
 
 
 @pytest.fixture(scope="function")
-def runpath_no_iter_dir(
-    tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path
-) -> Path:
+def runpath_no_iter_dir(make_runpath: Callable[..., Path]) -> Path:
     """Runpath without an iter dir."""
-    runpath = tmp_path / ERT_CASE_DATA_NO_ITER
-    shutil.copytree(rootpath / ERT_CASE_DATA_NO_ITER, runpath)
-    create_drogon_fmu_dir(runpath)
-
-    rootpath = runpath / "realization-1"
-
-    monkeypatch.setenv("_ERT_ITERATION_NUMBER", "0")
-    monkeypatch.setenv("_ERT_REALIZATION_NUMBER", "1")
-    monkeypatch.setenv("_ERT_RUNPATH", str(rootpath))
-
-    monkeypatch.chdir(rootpath)
-    return rootpath
+    return make_runpath(
+        case_data=ERT_CASE_DATA_NO_ITER,
+        run_dir="realization-1",
+        env=ERTRUN_ENV_REAL1_ITER0,
+    )
 
 
 @pytest.fixture(scope="function")
-def runpath_no_dotfmu_pred(
-    tmp_path: Path, monkeypatch: MonkeyPatch, rootpath: Path
-) -> Path:
+def runpath_no_dotfmu_pred(make_runpath: Callable[..., Path]) -> Path:
     """Prediction runpath with no .fmu/ dir."""
-    runpath = tmp_path / ERT_CASE_DATA
-    shutil.copytree(rootpath / ERT_CASE_DATA, runpath)
-    rootpath = runpath / "realization-0/pred"
-
-    _set_fmurun_env_variables(monkeypatch, runpath=rootpath)
-
-    monkeypatch.chdir(rootpath)
-    return rootpath
+    return make_runpath(run_dir="realization-0/pred", dotfmu=False)
 
 
 @pytest.fixture(scope="function")
@@ -256,7 +250,7 @@ def rmssetup(
     rmspath.mkdir(parents=True, exist_ok=True)
     shutil.copy(drogon_global_config_path, rmspath)
 
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
 
     return rmspath
 
@@ -274,7 +268,7 @@ def rmssetup_with_fmuconfig(
     fmuconfigpath.mkdir(parents=True, exist_ok=True)
     shutil.copy(drogon_global_config_path, fmuconfigpath)
 
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
 
     return rmspath
 
@@ -285,16 +279,19 @@ def rmsglobalconfig(rmssetup: Path, monkeypatch: MonkeyPatch) -> dict[str, Any]:
     monkeypatch.chdir(rmssetup)
     logger.debug("Global config is %s", str(rmssetup / "global_variables.yml"))
     with open("global_variables.yml", encoding="utf8") as stream:
-        global_cfg = yaml.safe_load(stream)
+        global_cfg = yaml.load(stream, Loader=SafeLoader)
 
     logger.debug("Ran setup for %s", "rmsglobalconfig")
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return global_cfg
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def mock_global_config_validated() -> global_configuration.GlobalConfiguration:
-    """Minimalistic global config variables no. 1 in ExportData class."""
+    """Minimalistic global config variables no. 1 in ExportData class.
+
+    Session scoped as it is only read by the tests. Use ``mock_global_config`` to get
+    a dictionary that can be modified."""
     return global_configuration.GlobalConfiguration(
         masterdata=Masterdata(
             smda=Smda(
@@ -350,7 +347,9 @@ def mock_global_config_validated() -> global_configuration.GlobalConfiguration:
 def mock_global_config(
     mock_global_config_validated: global_configuration.GlobalConfiguration,
 ) -> dict[str, Any]:
-    """Minimalistic global config variables no. 1 in ExportData class."""
+    """Minimalistic global config variables no. 1 in ExportData class.
+
+    A new dictionary is dumped for every test, so it is safe to modify."""
     return mock_global_config_validated.model_dump(exclude_none=True)
 
 
@@ -394,8 +393,7 @@ def timeseries_exportdata(mock_global_config: dict[str, Any]) -> ExportData:
 @pytest.fixture(scope="function")
 def drogon_global_config(drogon_global_config_path: Path) -> dict[str, Any]:
     """Drogon's global config from file state variable in ExportData class."""
-    with open(drogon_global_config_path, encoding="utf-8") as stream:
-        return yaml.safe_load(stream)
+    return _load_yaml_cached(drogon_global_config_path)
 
 
 @pytest.fixture(scope="function")
@@ -436,14 +434,14 @@ def metadata_examples() -> dict[str, Any]:
 @pytest.fixture(scope="function")
 def regsurf_nan_only() -> xtgeo.RegularSurface:
     """Create an xtgeo surface with only NaNs."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.RegularSurface(ncol=12, nrow=10, xinc=20, yinc=20, values=np.nan)
 
 
 @pytest.fixture(scope="function")
 def regsurf_masked_only() -> xtgeo.RegularSurface:
     """Create an xtgeo surface with only masked values."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     regsurf = xtgeo.RegularSurface(ncol=12, nrow=10, xinc=20, yinc=20, values=1000)
     regsurf.values = np.ma.masked_array(regsurf.values, mask=True)
     return regsurf
@@ -457,27 +455,26 @@ def regsurf_masked_only() -> xtgeo.RegularSurface:
 @pytest.fixture(scope="function")
 def regsurf() -> xtgeo.RegularSurface:
     """Create an xtgeo surface."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.RegularSurface(ncol=12, nrow=10, xinc=20, yinc=20, values=1234.0)
 
 
 @pytest.fixture(scope="function")
 def faultroom_object(drogon_global_config: dict[str, Any]) -> FaultRoomSurface:
     """Create a faultroom object."""
-    logger.debug("Ran %s", _current_function_name())
-    cfg = deepcopy(drogon_global_config)
+    _log_fixture_ran()
 
-    horizons = cfg["rms"]["horizons"]["TOP_RES"]
+    horizons = drogon_global_config["rms"]["horizons"]["TOP_RES"]
     faults = ["F1", "F2", "F3", "F4", "F5", "F6"]
-    juxtaposition_hw = cfg["rms"]["zones"]["ZONE_RES"]
-    juxtaposition_fw = cfg["rms"]["zones"]["ZONE_RES"]
+    juxtaposition_hw = drogon_global_config["rms"]["zones"]["ZONE_RES"]
+    juxtaposition_fw = drogon_global_config["rms"]["zones"]["ZONE_RES"]
     juxtaposition = {"fw": juxtaposition_fw, "hw": juxtaposition_hw}
     properties = [
         "Juxtaposition",
     ]
     coordinates = [[[1.1, 1.2, 1.3], [2.1, 2.2, 2.3]]]
     features = [{"geometry": {"coordinates": coordinates}}]
-    name = cfg["access"]["asset"]["name"]
+    name = drogon_global_config["access"]["asset"]["name"]
 
     faultroom_data = {
         "horizons": horizons,
@@ -490,10 +487,10 @@ def faultroom_object(drogon_global_config: dict[str, Any]) -> FaultRoomSurface:
     return FaultRoomSurface({"metadata": faultroom_data, "features": features})
 
 
-@pytest.fixture()
-def tsurf() -> TSurfData:
+@pytest.fixture(scope="session")
+def _tsurf_session() -> TSurfData:
     """
-    Create a basic TSurfData object from a dictionary.
+    Create a basic TSurfData object from a dictionary, once per session.
     """
 
     tsurf_dict: dict[str, Any] = {}
@@ -510,32 +507,40 @@ def tsurf() -> TSurfData:
             (1.1, 1.2, 1.3),
             (2.1, 2.2, 2.3),
             (3.1, 3.2, 3.3),
-        ]
-    ).astype(np.float64)
-    tsurf_dict["triangles"] = np.array([(1, 2, 3), (1, 2, 4)]).astype(np.int64)
+        ],
+        dtype=np.float64,
+    )
+    tsurf_dict["triangles"] = np.array([(1, 2, 3), (1, 2, 4)], dtype=np.int64)
 
     return TSurfData.model_validate(tsurf_dict)
 
 
 @pytest.fixture()
-def tsurf_as_lines(tsurf: TSurfData) -> list[str]:
+def tsurf(_tsurf_session: TSurfData) -> TSurfData:
     """
-    Create lines to simulate the results of parsing a file with a basic TSurf object.
+    Return a copy of the basic TSurfData object.
+
+    Deep copied since some tests modify the nested coordinate system in place.
     """
+    return _tsurf_session.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def _tsurf_as_lines_session(_tsurf_session: TSurfData) -> tuple[str, ...]:
+    """
+    Create lines to simulate the results of parsing a file with a basic TSurf object,
+    once per session.
+    """
+    tsurf = _tsurf_session
 
     vertices_lines = [
-        f"VRTX {i + 1} {tsurf.vertices[i][0]} {tsurf.vertices[i][1]} "
-        f"{tsurf.vertices[i][2]} CNXYZ"
-        for i in range(len(tsurf.vertices))
+        f"VRTX {i} {x} {y} {z} CNXYZ" for i, (x, y, z) in enumerate(tsurf.vertices, 1)
     ]
 
-    triangles_lines = [
-        f"TRGL {tsurf.triangles[i][0]} {tsurf.triangles[i][1]} {tsurf.triangles[i][2]}"
-        for i in range(len(tsurf.triangles))
-    ]
+    triangles_lines = [f"TRGL {a} {b} {c}" for a, b, c in tsurf.triangles]
 
     assert tsurf.coordinate_system is not None
-    return [
+    return (
         "GOCAD TSurf 1",
         "HEADER {",
         f"name: {tsurf.header.name}",
@@ -554,13 +559,21 @@ def tsurf_as_lines(tsurf: TSurfData) -> list[str]:
         *vertices_lines,
         *triangles_lines,
         "END",
-    ]
+    )
+
+
+@pytest.fixture()
+def tsurf_as_lines(_tsurf_as_lines_session: tuple[str, ...]) -> list[str]:
+    """
+    Return a new list with the lines of the basic TSurf object, for tests to modify.
+    """
+    return list(_tsurf_as_lines_session)
 
 
 @pytest.fixture(scope="function")
 def polygons() -> xtgeo.Polygons:
     """Create an xtgeo polygons."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.Polygons(
         [
             [1, 22, 3, 0],
@@ -574,7 +587,7 @@ def polygons() -> xtgeo.Polygons:
 @pytest.fixture(scope="function")
 def fault_line() -> xtgeo.Polygons:
     """Create an xtgeo polygons."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.Polygons(
         [
             [1, 22, 3, 0, "F1"],
@@ -589,7 +602,7 @@ def fault_line() -> xtgeo.Polygons:
 @pytest.fixture(scope="function")
 def points() -> xtgeo.Points:
     """Create an xtgeo points instance."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.Points(
         [
             [1, 22, 3, "WELLA"],
@@ -604,35 +617,35 @@ def points() -> xtgeo.Points:
 @pytest.fixture(scope="function")
 def cube() -> xtgeo.Cube:
     """Create an xtgeo cube instance."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.Cube(ncol=3, nrow=4, nlay=5, xinc=12, yinc=12, zinc=4, rotation=30)
 
 
 @pytest.fixture(scope="function")
 def grid() -> xtgeo.Grid:
     """Create an xtgeo grid instance."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.create_box_grid((3, 4, 5))
 
 
 @pytest.fixture(scope="function")
 def gridproperty() -> xtgeo.GridProperty:
     """Create an xtgeo gridproperty instance."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return xtgeo.GridProperty(ncol=3, nrow=7, nlay=3, values=123.0)
 
 
 @pytest.fixture(scope="function")
 def dataframe() -> pd.DataFrame:
     """Create an pandas dataframe instance."""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return pd.DataFrame({"COL1": [1, 2, 3, 4], "COL2": [99.0, 98.0, 97.0, 96.0]})
 
 
 @pytest.fixture(scope="function")
 def wellpicks() -> pd.DataFrame:
     """Create a pandas dataframe containing wellpicks"""
-    logger.debug("Ran %s", _current_function_name())
+    _log_fixture_ran()
     return pd.DataFrame(
         {
             "X_UTME": [
@@ -664,17 +677,15 @@ def wellpicks() -> pd.DataFrame:
 @pytest.fixture(scope="function")
 def arrowtable() -> pa.Table:
     """Create an arrow table instance."""
-    return pa.Table.from_pandas(
-        pd.DataFrame(
-            {
-                "COL1": [1, 2, 3, 4],
-                "COL2": [99.0, 98.0, 97.0, 96.0],
-            }
-        )
+    return pa.table(
+        {
+            "COL1": pa.array([1, 2, 3, 4], type=pa.int64()),
+            "COL2": pa.array([99.0, 98.0, 97.0, 96.0], type=pa.float64()),
+        }
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_summary() -> pd.DataFrame:
     """Return summary mock data
 
@@ -684,25 +695,25 @@ def mock_summary() -> pd.DataFrame:
     return pd.DataFrame({"alf": ["A", "B", "C"], "DATE": [1, 2, 3]})
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_relperm() -> pd.DataFrame:
     """Return relperm mock data"""
     return pd.DataFrame({"alf": ["A", "B", "C"], "SATNUM": [1, 2, 3]})
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def drogon_summary(rootpath: Path) -> pa.Table:
     """Return pyarrow table
 
     Returns:
         pa.Table: table with summary data
     """
-    import pyarrow.feather as feather
-
-    return feather.read_table(rootpath / "tests/data/drogon/tabular/summary.arrow")
+    return feather.read_table(
+        rootpath / "tests/data/drogon/tabular/summary.arrow", memory_map=True
+    )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mock_volumes() -> pd.DataFrame:
     """Return volume mock data
 
@@ -721,19 +732,14 @@ def mock_volumes() -> pd.DataFrame:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def drogon_volumes(rootpath: Path) -> pa.Table:
     """Return pyarrow table
 
     Returns:
-        pa.Table: table with summary data
+        pa.Table: table with volumes data
     """
-
-    return pa.Table.from_pandas(
-        pd.read_csv(
-            rootpath / "tests/data/drogon/tabular/geogrid--vol.csv",
-        )
-    )
+    return pa_csv.read_csv(rootpath / "tests/data/drogon/tabular/geogrid--vol.csv")
 
 
 @pytest.fixture
@@ -752,14 +758,9 @@ def unregister_pandas_parquet() -> Generator[None, None, None]:
     # This condition may not be needed, or may not be sufficient
     if sys.modules.get("pandas"):
         try:
-            import pyarrow
-
-            try:
-                pyarrow.unregister_extension_type("pandas.interval")
-                pyarrow.unregister_extension_type("pandas.period")
-            except pyarrow.lib.ArrowKeyError:
-                # They might already be unregistered
-                pass
-            yield
-        except ImportError:
+            pa.unregister_extension_type("pandas.interval")
+            pa.unregister_extension_type("pandas.period")
+        except pa.lib.ArrowKeyError:
+            # They might already be unregistered
             pass
+        yield
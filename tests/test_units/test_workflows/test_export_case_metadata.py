@@ -6,7 +6,6 @@ interactive. Hence the basepath will be ../../
 
 import getpass
 import logging
-from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
@@ -17,10 +16,17 @@ from pydantic import ValidationError
 from pytest import MonkeyPatch
 
 from fmu.dataio._workflows.case.export_case_metadata import ExportCaseMetadata
+from tests.utils import SafeLoader
 
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture
+def caseroot(runpath_no_case_metadata: Path) -> Path:
+    """The case root of a runpath without existing case metadata."""
+    return runpath_no_case_metadata.parent.parent
+
+
 def test_crease_case_metadata_barebone(drogon_global_config: dict[str, Any]) -> None:
     case = ExportCaseMetadata(config=drogon_global_config, rootfolder="", casename="")
     assert isinstance(case.config, GlobalConfiguration)
@@ -31,11 +37,9 @@ def test_crease_case_metadata_barebone(drogon_global_config: dict[str, Any]) ->
 
 def test_export_case_metadata_post_init(
     monkeypatch: MonkeyPatch,
-    runpath_no_case_metadata: Path,
+    caseroot: Path,
     drogon_global_config: dict[str, Any],
 ) -> None:
-    caseroot = runpath_no_case_metadata.parent.parent
-
     icase = ExportCaseMetadata(
         config=drogon_global_config,
         rootfolder=caseroot,
@@ -50,13 +54,10 @@ def test_export_case_metadata_post_init(
 @pytest.mark.filterwarnings("ignore:The global configuration")
 def test_export_case_metadata_post_init_bad_globalconfig(
     monkeypatch: MonkeyPatch,
-    runpath_no_case_metadata: Path,
+    caseroot: Path,
     drogon_global_config: dict[str, Any],
 ) -> None:
-    caseroot = runpath_no_case_metadata.parent.parent
-
-    config = deepcopy(drogon_global_config)
-    del config["masterdata"]
+    config = {k: v for k, v in drogon_global_config.items() if k != "masterdata"}
 
     with pytest.raises(ValidationError, match="masterdata"):
         ExportCaseMetadata(
@@ -67,12 +68,10 @@ def test_export_case_metadata_post_init_bad_globalconfig(
 
 
 def test_export_case_metadata_establish_metadata_files(
-    monkeypatch: MonkeyPatch,
-    runpath_no_case_metadata: Path,
-    drogon_global_config: dict[str, Any],
+    tmp_path: Path, drogon_global_config: dict[str, Any]
 ) -> None:
     """Tests that the required directories are made when establishing the case"""
-    caseroot = runpath_no_case_metadata.parent.parent
+    caseroot = tmp_path
 
     icase = ExportCaseMetadata(
         config=drogon_global_config, rootfolder=caseroot, casename="mycase"
@@ -85,13 +84,11 @@ def test_export_case_metadata_establish_metadata_files(
 
 
 def test_export_case_metadata_establish_metadata_files_exists(
-    monkeypatch: MonkeyPatch,
-    runpath_no_case_metadata: Path,
-    drogon_global_config: dict[str, Any],
+    tmp_path: Path, drogon_global_config: dict[str, Any]
 ) -> None:
     """Tests that _establish_metadata_files returns correctly if the share/metadata
     directory already exists."""
-    caseroot = runpath_no_case_metadata.parent.parent
+    caseroot = tmp_path
 
     icase = ExportCaseMetadata(
         config=drogon_global_config, rootfolder=caseroot, casename="mycase"
@@ -107,11 +104,9 @@ def test_export_case_metadata_establish_metadata_files_exists(
 
 def test_export_case_metadata_generate_metadata(
     monkeypatch: MonkeyPatch,
-    runpath_no_case_metadata: Path,
+    caseroot: Path,
     drogon_global_config: dict[str, Any],
 ) -> None:
-    caseroot = runpath_no_case_metadata.parent.parent
-
     icase = ExportCaseMetadata(
         config=drogon_global_config, rootfolder=caseroot, casename="mycase"
     )
@@ -141,10 +136,8 @@ def test_export_case_metadata_generate_metadata_warn_if_exists(
 def test_export_case_metadata_with_export(
     monkeypatch: MonkeyPatch,
     drogon_global_config: dict[str, Any],
-    runpath_no_case_metadata: Path,
+    caseroot: Path,
 ) -> None:
-    caseroot = runpath_no_case_metadata.parent.parent
-
     icase = ExportCaseMetadata(
         config=drogon_global_config,
         rootfolder=caseroot,
@@ -155,7 +148,7 @@ def test_export_case_metadata_with_export(
     assert fmu_case_yml == caseroot / "share/metadata/fmu_case.yml"
 
     with open(fmu_case_yml) as stream:
-        metadata = yaml.safe_load(stream)
+        metadata = yaml.load(stream, Loader=SafeLoader)
 
     assert metadata["fmu"]["case"]["name"] == "MyCaseName"
     assert metadata["masterdata"]["smda"]["field"][0]["identifier"] == "DROGON"
@@ -164,10 +157,8 @@ def test_export_case_metadata_with_export(
 def test_export_case_metadata_export_with_norsk_alphabet(
     monkeypatch: MonkeyPatch,
     drogon_global_config: dict[str, Any],
-    runpath_no_case_metadata: Path,
+    caseroot: Path,
 ) -> None:
-    caseroot = runpath_no_case_metadata.parent.parent
-
     drogon_global_config["masterdata"]["smda"]["field"][0]["identifier"] = "æøå"
     case = ExportCaseMetadata(
         config=drogon_global_config,
@@ -180,7 +171,7 @@ def test_export_case_metadata_export_with_norsk_alphabet(
     assert fmu_case_yml == caseroot / "share/metadata/fmu_case.yml"
 
     with open(fmu_case_yml) as stream:
-        metadata = yaml.safe_load(stream)
+        metadata = yaml.load(stream, Loader=SafeLoader)
 
     assert metadata["fmu"]["case"]["name"] == "MyCaseName_with_Æ"
     assert metadata["masterdata"]["smda"]["field"][0]["identifier"] == "æøå"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
 import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, get_args
 
 import yaml
 from pydantic import BaseModel
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 YamlLike = (
     dict[str, Any]
     | list[Any]
@@ -23,7 +29,7 @@ YamlLike = (
 def _parse_yaml(yaml_path: str | Path) -> YamlLike:
     """Parse the filename as json, return data"""
     with open(yaml_path, encoding="utf-8") as stream:
-        data = yaml.safe_load(stream)
+        data = yaml.load(stream, Loader=SafeLoader)
 
     return _isoformat_all_datetimes(data)
 
@@ -43,9 +49,12 @@ def _isoformat_all_datetimes(indate: YamlLike) -> YamlLike:
     return indate
 
 
+@lru_cache(maxsize=1)
 def _metadata_examples() -> dict[str, Any]:
+    """Parse all metadata examples. The result is cached and shared between callers,
+    so copy an example before modifying it."""
     return {
-        path.name: _isoformat_all_datetimes(_parse_yaml(path))
+        path.name: _parse_yaml(path)
         for path in Path(".").absolute().glob("examples/example_metadata/*.yml")
     }
 